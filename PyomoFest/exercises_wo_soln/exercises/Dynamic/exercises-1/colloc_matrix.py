@@ -2,29 +2,77 @@ import numpy
 
 cp = [0, 0.155051, 0.644949, 1]
 
-a = []
-
-print('[')
-for i in range(len(cp)):
-    ptmp = []
-    tmp = 0
-    for j in range(len(cp)):
-        if j != i:
-            row = []
-            row.insert(0,1/(cp[i]-cp[j]))
-            row.insert(1,-cp[j]/(cp[i]-cp[j]))
-            ptmp.insert(tmp,row)
-            tmp += 1
-    p=[1]
-    for j in range(len(cp)-1):
-        p = numpy.convolve(p,ptmp[j])
-    pder = numpy.polyder(p,1)
-    arow = []
-    for j in range(len(cp)):
-        arow.append(numpy.polyval(pder,cp[j]))
-    a.append(arow)
-    print(str(arow)+',')
-print(']')
-
-
-                                                              
+# Radau collocation matrix for the points in cp, a[i][k] is the derivative of
+# the i-th Lagrange polynomial at cp[k]. Regenerate by running this file.
+a = numpy.array([
+    [-9.000001008080126, -4.139388773624379, 1.7393879671602777, -3.0000002520200315],
+    [10.048810106494384, 3.224746191683931, -3.5678400771209375, 5.531972415060629],
+    [-1.382142403745367, 1.167839841902244, 0.7752546483828557, -7.531972331053937],
+    [0.33333330533110994, -0.2531972599617956, 1.0531974615778041, 5.00000016801334],
+])
+
+
+def colloc_matrix(cp):
+    cp = numpy.asarray(cp, dtype=float)
+    N = len(cp)
+
+    # pairwise differences D[k,j] = cp[k] - cp[j], with ones on the diagonal
+    # so that row products skip the j == k term
+    D = cp[:,None] - cp[None,:]
+    numpy.fill_diagonal(D, 1.0)
+
+    # denominator of each Lagrange polynomial, prod_{j != i} (cp[i] - cp[j])
+    denom = D.prod(axis=1)
+
+    # off-diagonal derivatives, a[i,k] = prod_{j != i,k} (cp[k] - cp[j]) / denom[i]
+    mask = numpy.ones((N, N, N), dtype=bool)
+    idx = numpy.arange(N)
+    mask[idx, :, idx] = False
+    mask[:, idx, idx] = False
+    num = numpy.where(mask, D[None,:,:], 1.0).prod(axis=2)
+    a = num/denom[:,None]
+
+    # diagonal derivatives, a[i,i] = sum_{j != i} 1/(cp[i] - cp[j])
+    numpy.fill_diagonal(D, numpy.inf)
+    numpy.fill_diagonal(a, (1.0/D).sum(axis=1))
+    return a
+
+
+# loop form of the same closed form expressions, compiled with numba by
+# colloc_matrix_numba() for larger sets of collocation points
+def _colloc_loops(cp):
+    N = cp.shape[0]
+    a = numpy.empty((N, N))
+    for i in range(N):
+        denom = 1.0
+        diag = 0.0
+        for j in range(N):
+            if j != i:
+                denom *= cp[i] - cp[j]
+                diag += 1.0/(cp[i] - cp[j])
+        for k in range(N):
+            if k == i:
+                a[i,k] = diag
+            else:
+                num = 1.0
+                for j in range(N):
+                    if j != i and j != k:
+                        num *= cp[k] - cp[j]
+                a[i,k] = num/denom
+    return a
+
+_colloc_jit = None
+
+def colloc_matrix_numba(cp):
+    global _colloc_jit
+    if _colloc_jit is None:
+        from numba import njit
+        _colloc_jit = njit(cache=True)(_colloc_loops)
+    return _colloc_jit(numpy.asarray(cp, dtype=float))
+
+
+if __name__ == "__main__":
+    print('[')
+    for arow in colloc_matrix(cp).tolist():
+        print(str(arow)+',')
+    print(']')
@@ -1,15 +1,18 @@
 from pyomo.environ import *
 from pyomo.dae import *
 
-a_conc = {0.1:0.606, 0.2:0.368, 0.3:0.223, 0.4:0.135, 0.5:0.082,
-          0.6:0.05, 0.7:0.03, 0.8:0.018, 0.9:0.011, 1.0:0.007}
+# measurement times, in increasing order
+meas_times = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0)
 
-b_conc = {0.1:0.373, 0.2:0.564, 0.3:0.647, 0.4:0.669, 0.5:0.656,
-          0.6:0.624, 0.7:0.583, 0.8:0.539, 0.9:0.494, 1.0:0.451}
+a_conc = dict(zip(meas_times, (0.606, 0.368, 0.223, 0.135, 0.082,
+                               0.05, 0.03, 0.018, 0.011, 0.007)))
+
+b_conc = dict(zip(meas_times, (0.373, 0.564, 0.647, 0.669, 0.656,
+                               0.624, 0.583, 0.539, 0.494, 0.451)))
 
 m = ConcreteModel()
 
-m.meas_time = Set(initialize=sorted(a_conc.keys()),ordered=True)
+m.meas_time = Set(initialize=meas_times, ordered=True)
 m.ameas = Param(m.meas_time, initialize=a_conc)
 m.bmeas = Param(m.meas_time, initialize=b_conc)
 
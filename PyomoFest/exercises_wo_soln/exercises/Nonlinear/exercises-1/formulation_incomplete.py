@@ -1,4 +1,5 @@
 from pyomo.environ import *
+from ipopt_opts import configure_ipopt
 
 model = ConcreteModel()
 
@@ -13,7 +14,7 @@ def con_rule(m):
     # TODO: SPECIFY CONSTRAINT HERE
 model.con = Constraint(rule=con_rule)
 
-solver = SolverFactory('ipopt')
+solver = configure_ipopt(SolverFactory('ipopt'))
 solver.solve(model, tee=True)
 
 print(value(model.x))
@@ -0,0 +1,19 @@
+# ipopt_opts.py: Ipopt options shared by the nonlinear exercises
+import os
+from pyomo.environ import SolverFactory
+
+# MUMPS ships with every Ipopt build. With an Ipopt linked against HSL, such
+# as the one installed by `idaes get-extensions`, set IPOPT_LINEAR_SOLVER to
+# ma27 or ma57 for faster factorizations.
+linear_solver = os.environ.get('IPOPT_LINEAR_SOLVER', 'mumps')
+
+ipopt_options = {'linear_solver': linear_solver}
+if linear_solver == 'ma57':
+    ipopt_options['ma57_automatic_scaling'] = 'yes'
+
+def configure_ipopt(solver=None):
+    if solver is None:
+        solver = SolverFactory('ipopt')
+    for key, val in ipopt_options.items():
+        solver.options[key] = val
+    return solver
@@ -1,5 +1,6 @@
 # rosenbrock_soln.py
 from pyomo.environ import *
+from ipopt_opts import configure_ipopt
 
 model = ConcreteModel()
 model.x = Var(initialize=1.5)
@@ -10,5 +11,5 @@ def rosenbrock(model):
         + 100.0*(model.y - model.x**2)**2
 model.obj = Objective(rule=rosenbrock, sense=minimize)
 
-SolverFactory('ipopt').solve(model)
+configure_ipopt(SolverFactory('ipopt')).solve(model)
 model.pprint()
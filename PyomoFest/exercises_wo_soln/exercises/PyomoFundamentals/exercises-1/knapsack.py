@@ -9,13 +9,15 @@ model = ConcreteModel()
 model.x = Var( A, within=Binary )
 
 model.obj = Objective(
-    expr = sum( b[i]*model.x[i] for i in A ), 
+    expr = quicksum( b[i]*model.x[i] for i in A ), 
     sense = maximize )
 
 model.weight_con = Constraint(
-    expr = sum( w[i]*model.x[i] for i in A ) <= W_max )
+    expr = quicksum( w[i]*model.x[i] for i in A ) <= W_max )
 
 opt = SolverFactory('glpk')
+opt.options['tmlim'] = 10
+opt.options['mipgap'] = 1e-6
 opt_success = opt.solve(model)
 
 model.display()
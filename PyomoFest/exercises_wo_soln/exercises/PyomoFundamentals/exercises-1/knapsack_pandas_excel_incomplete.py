@@ -5,6 +5,7 @@ df_items = pd.read_excel('knapsack_data.xlsx', sheet_name='data', header=0, inde
 W_max = 14
 
 A = df_items.index.tolist()
+# hint: a DataFrame column is a pandas Series, see Series.to_dict()
 b = # TODO: WRITE CODE TO GET A DICTIONARY FROM THE DATAFRAME
 w = # TODO: WRITE CODE TO GET A DICTIONARY FROM THE DATAFRAME
 
@@ -12,11 +13,11 @@ model = ConcreteModel()
 model.x = Var( A, within=Binary )
 
 model.obj = Objective(
-    expr = sum( b[i]*model.x[i] for i in A ), 
+    expr = quicksum( b[i]*model.x[i] for i in A ), 
     sense = maximize )
 
 model.weight_con = Constraint(
-    expr = sum( w[i]*model.x[i] for i in A ) <= W_max )
+    expr = quicksum( w[i]*model.x[i] for i in A ) <= W_max )
 
 opt = SolverFactory('glpk')
 opt_success = opt.solve(model)
@@ -1,3 +1,4 @@
+import numpy as np
 from pyomo.environ import *
 
 A = ['hammer', 'wrench', 'screwdriver', 'towel']
@@ -9,16 +10,18 @@ model = ConcreteModel()
 model.x = Var( A, within=Binary )
 
 model.obj = Objective(
-    expr = sum( b[i]*model.x[i] for i in A ), 
+    expr = quicksum( b[i]*model.x[i] for i in A ), 
     sense = maximize )
 
 model.weight_con = Constraint(
-    expr = sum( w[i]*model.x[i] for i in A ) <= W_max )
+    expr = quicksum( w[i]*model.x[i] for i in A ) <= W_max )
 
 opt = SolverFactory('glpk')
 opt_success = opt.solve(model)
 
-total_weight = sum( w[i]*value(model.x[i]) for i in A )
+xs = np.fromiter((value(model.x[i]) for i in A), dtype=float, count=len(A))
+ws = np.fromiter((w[i] for i in A), dtype=float, count=len(A))
+total_weight = float(np.dot(ws, xs))
 # TODO: INSERT CODE HERE TO PRINT TOTAL WEIGHT AND BENEFIT
 
 print('%12s %12s' % ('Item', 'Selected'))
@@ -1,5 +1,8 @@
 # warehouse_location.py: Warehouse location determination problem
+from itertools import product
+import numpy as np
 from pyomo.environ import *
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 model = ConcreteModel(name="(WL)")
 
@@ -19,26 +22,37 @@ d = {('Harlingen', 'NYC'): 1956, \
      ('Ashland', 'Houston'): 1236 }
 P = 2
 
-model.x = Var(W, C, bounds=(0,1))
-model.y = Var(W, within=Binary)
+# distances as a |W| x |C| array, rows in the order of W and columns in the
+# order of C
+D = np.array([[d[w,c] for c in C] for w in W], dtype=float)
+
+model.x = Var(W, C, bounds=(0,1), initialize=0.0)
+model.y = Var(W, within=Binary, initialize=0)
 
 def obj_rule(m):
-    return sum(d[w,c]*m.x[w,c] for w in W for c in C)
+    return LinearExpression(constant=0,
+        linear_coefs=D.ravel().tolist(),
+        linear_vars=[m.x[w,c] for w in W for c in C])
 model.obj = Objective(rule=obj_rule)
 
 def one_per_cust_rule(m, c):
-    return sum(m.x[w,c] for w in W) == 1
+    return quicksum(m.x[w,c] for w in W) == 1
 model.one_per_cust = Constraint(C, rule=one_per_cust_rule)
 
-def warehouse_active_rule(m, w, c):
-    return m.x[w,c] <= m.y[w]
-model.warehouse_active = Constraint(W, C, rule=warehouse_active_rule)
+model.warehouse_active = ConstraintList()
+for w, c in product(W, C):
+    model.warehouse_active.add(model.x[w,c] <= model.y[w])
 
 def num_warehouses_rule(m):
-    return sum(m.y[w] for w in W) <= P
+    return LinearExpression(constant=0,
+        linear_coefs=[1]*len(W),
+        linear_vars=[m.y[w] for w in W]) <= P
 model.num_warehouses = Constraint(rule=num_warehouses_rule)
 
-SolverFactory('glpk').solve(model)
+opt = SolverFactory('glpk')
+opt.options['tmlim'] = 10
+opt.options['mipgap'] = 1e-6
+opt.solve(model)
 
 model.y.pprint()
 model.x.pprint()
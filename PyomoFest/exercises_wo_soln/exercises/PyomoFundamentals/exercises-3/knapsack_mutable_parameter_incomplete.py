@@ -10,14 +10,16 @@ model.x = Var( A, within=Binary )
 model.item_benefit = # TODO: DEFINE THE PYOMO PARAM HERE
 
 def obj_rule(m):
-    return sum( m.item_benefit[i]*m.x[i] for i in A )
+    return quicksum( m.item_benefit[i]*m.x[i] for i in A )
 model.obj = Objective(rule=obj_rule, sense = maximize )
 
 def weight_rule(m):
-    return sum( w[i]*m.x[i] for i in A ) <= W_max
+    return quicksum( w[i]*m.x[i] for i in A ) <= W_max
 model.weight = Constraint(rule=weight_rule)
 
-opt = SolverFactory('glpk')
+# appsi_highs is a persistent interface, after the first solve only the
+# changed objective coefficient is sent to the solver
+opt = SolverFactory('appsi_highs')
 
 for wrench_benefit in range(1,11):
     model.item_benefit['wrench'] = wrench_benefit
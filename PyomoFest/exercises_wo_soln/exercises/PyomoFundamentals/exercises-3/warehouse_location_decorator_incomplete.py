@@ -1,5 +1,7 @@
 # warehouse_location.py: Warehouse location determination problem
+import numpy as np
 from pyomo.environ import *
+from pyomo.core.expr.numeric_expr import LinearExpression
 
 model = ConcreteModel(name="(WL)")
 
@@ -19,16 +21,22 @@ d = {('Harlingen', 'NYC'): 1956, \
      ('Ashland', 'Houston'): 1236 }
 P = 2
 
-model.x = Var(W, C, bounds=(0,1))
-model.y = Var(W, within=Binary)
+# distances as a |W| x |C| array, rows in the order of W and columns in the
+# order of C
+D = np.array([[d[w,c] for c in C] for w in W], dtype=float)
+
+model.x = Var(W, C, bounds=(0,1), initialize=0.0)
+model.y = Var(W, within=Binary, initialize=0)
 
 @model.Objective()
 def obj(m):
-    return sum(d[w,c]*m.x[w,c] for w in W for c in C)
+    return LinearExpression(constant=0,
+        linear_coefs=D.ravel().tolist(),
+        linear_vars=[m.x[w,c] for w in W for c in C])
 
 @model.Constraint(C)
 def one_per_cust(m, c):
-    return sum(m.x[w,c] for w in W) == 1
+    return quicksum(m.x[w,c] for w in W) == 1
 
 # TODO: ADD DECORATOR HERE
 def warehouse_active(m, w, c):
@@ -36,7 +44,9 @@ def warehouse_active(m, w, c):
 
 # TODO: ADD DECORATOR HERE
 def num_warehouses(m):
-    return sum(m.y[w] for w in W) <= P
+    return LinearExpression(constant=0,
+        linear_coefs=[1]*len(W),
+        linear_vars=[m.y[w] for w in W]) <= P
 
 SolverFactory('glpk').solve(model)
 
@@ -1,5 +1,6 @@
 from pyomo.environ import *
 from pyomo.gdp import *
+from itertools import combinations
 
 # Strip-packing example from http://minlp.org/library/lib.php?lib=GDP
 
@@ -37,10 +38,8 @@ model.y = Var( model.RECTANGLES,
 model.MaxLength = Var(within=NonNegativeReals)
 
 # generate the list of possible rectangle conflicts (which are any pair)
-def rec_pairs_filter(model, i, j):
-    return i < j
-model.OVERLAP_PAIRS = Set(initialize=model.RECTANGLES * model.RECTANGLES,
-    dimen=2, filter=rec_pairs_filter)
+model.OVERLAP_PAIRS = Set(initialize=combinations(model.RECTANGLES, 2),
+    dimen=2)
 
 # strip length constraint
 @model.Constraint(model.RECTANGLES)
@@ -68,7 +67,10 @@ TransformationFactory('gdp.chull').apply_to(model)
 #
 # Solve and print the solution
 #
-SolverFactory('glpk').solve(model, tee=True)
+opt = SolverFactory('glpk')
+opt.options['tmlim'] = 10
+opt.options['mipgap'] = 1e-6
+opt.solve(model, tee=True)
 for i in model.RECTANGLES:
     print("Rectangle %s: (%s, %s)" % (i, value(model.x[i]), value(model.y[i])))
 model.total_length.display()
@@ -10,8 +10,18 @@
 
 # Answer:
 
+from pyomo.environ import *
+
 m = ConcreteModel()
 m.toucans = RangeSet(100)
 m.x = Var(m.toucans, domain=Binary,
           doc="Binary variable denoting selection of a toucan.")
 m.pick_one_toucan = Constraint(expr=sum(m.x[i] for i in m.toucans) == 1)
+
+# For large index sets the same constraint can be built directly as a
+# LinearExpression, which skips constructing the sum term by term:
+#
+# from pyomo.core.expr.numeric_expr import LinearExpression
+# m.pick_one_toucan = Constraint(expr=LinearExpression(constant=0,
+#     linear_coefs=[1]*len(m.toucans),
+#     linear_vars=[m.x[i] for i in m.toucans]) == 1)
@@ -1,10 +1,15 @@
 from warehouse_location import model
 
+# scenario instances, cloned from model once per scenario name
+scenarios = {}
+
 def pysp_instance_creation_callback(scenario_name, node_list):
-    scenario = model.clone()
     assert scenario_name in ("s1","s2")
-    if scenario_name == "s2":
-        w = "Harlingen"
-        for c in ["NYC", "LA", "Chicago"]:
-            scenario.d[w,c] = scenario.d[w,c].value + 1000
-    return scenario
+    if scenario_name not in scenarios:
+        scenario = model.clone()
+        if scenario_name == "s2":
+            w = "Harlingen"
+            for c in ["NYC", "LA", "Chicago"]:
+                scenario.d[w,c] = scenario.d[w,c].value + 1000
+        scenarios[scenario_name] = scenario
+    return scenarios[scenario_name]